@@ -1,5 +1,16 @@
+import ctypes
+import ctypes.util
+import errno
+import json
 import logging
+import logging.handlers
+import mmap
+import os
+import queue
+import select
 import signal
+import socket
+import struct
 import sys
 import threading
 import time
@@ -7,17 +18,413 @@ from datetime import datetime
 from typing import Optional, Tuple
 
 try:
-    import adafruit_ds3231
-    import adafruit_fram
     import board
-    import ntplib
     import RPi.GPIO as GPIO
+    from adafruit_bus_device.i2c_device import I2CDevice
 
     HARDWARE_AVAILABLE = True
 except ImportError:
     print("Hardware modules not available, running in simulation mode")
     HARDWARE_AVAILABLE = False
-from flask import Flask, redirect, render_template, request, url_for
+from flask import Flask, Response, redirect, render_template, request, url_for
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that parses requests and serializes responses with orjson"""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
+
+# Linux timer constants used by the absolute-deadline scheduler
+CLOCK_MONOTONIC = 1
+TIMER_ABSTIME = 1
+PR_SET_TIMERSLACK = 29
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+MCL_ONFAULT = 4
+
+# Nice value for threads doing work that can wait, so they never delay a tick
+BACKGROUND_NICE = 10
+# SCHED_FIFO priority of the tick threads, kept below the kernel's threaded IRQ
+# handlers (50) so the I2C transfers made from the tick loop still complete
+TICK_RT_PRIORITY = 20
+
+# Intervals shorter than this are timed with a busy-wait instead of a sleep
+BUSY_WAIT_THRESHOLD_NS = 5_000_000
+# Final stretch of longer intervals that is busy-waited after sleeping
+BUSY_WAIT_TAIL_NS = 500_000
+
+# Longest wait for the RTC writer to finish when shutting down, in seconds
+SHUTDOWN_TIMEOUT = 1.0
+
+# Distinct pulse waveforms kept in the pigpio daemon before they are rebuilt
+PIGPIO_MAX_WAVES = 32
+
+# DS3231 I2C address and timekeeping registers
+DS3231_ADDRESS = 0x68
+DS3231_REG_SECONDS = b"\x00"
+DS3231_REG_CONTROL = b"\x0e"  # Followed by the status register
+DS3231_EOSC = 0x80  # Control: oscillator disabled on battery
+DS3231_OSF = 0x80  # Status: oscillator stopped (time lost)
+
+# NTP client packet layout (RFC 5905) and epoch offset from 1900 to 1970
+NTP_PORT = 123
+NTP_TIMEOUT = 2  # Replies slower than NTP_MAX_DELAY are rejected anyway
+NTP_POLL_INTERVAL = 0.1  # How often a pending request checks for shutdown
+NTP_RESOLVE_TTL = 60  # Seconds before the server name is resolved again
+NTP_MAX_DELAY = 0.5  # Round-trip delay above which a sample is rejected
+NTP_SAMPLES = 3  # Samples per sync, the one with the lowest delay is used
+NTP_EPOCH_OFFSET = 2208988800
+NTP_PACKET = struct.Struct("!BBbb11I")
+NTP_CLIENT_MODE = 0x1B  # LI = 0, VN = 3, Mode = 3 (client)
+NTP_TRANSMIT_OFFSET = 40  # Byte offset of the transmit timestamp
+NTP_LEAP_ALARM = 3  # Leap indicator of a server whose clock is unsynchronized
+NTP_MAX_POLL_INTERVAL = 1024  # Longest interval the poll backoff reaches (2^10 s)
+NTP_STABLE_OFFSET_STEP = 0.05  # Offset change between samples counted as stable
+NTP_DRIFT_CACHE_TTL = 16  # Seconds an offset is shown to the UI before re-querying
+
+# Linux socket option for kernel receive timestamps (not exported by socket)
+SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35)
+NTP_ANCILLARY_SIZE = socket.CMSG_SPACE(16)  # Room for a 64-bit struct timespec
+
+# Polled clock endpoints must be revalidated by browsers and proxies every time
+NO_CACHE = {"Cache-Control": "no-cache"}
+# Static files carry their modification time in the URL, so browsers may keep them
+STATIC_MAX_AGE = 86400
+
+# JSON keys of /api/pulsing_config and the ClockController attributes they set
+PULSING_CONFIG = {
+    "normal_tick_ms": "norm_tick_ms",
+    "normal_tick_on_us": "norm_tick_on_us",
+    "fast_forward_tick_ms": "fwd_tick_ms",
+    "fast_forward_tick_on_us": "fwd_tick_on_us",
+    "fast_forward_count_mask": "fwd_count_mask",
+    "fast_forward_speedup": "fwd_speedup",
+    "fast_forward_burst_threshold_ss": "fwd_burst_threshold_ss",
+    "fast_forward_burst_max_ticks": "fwd_burst_max_ticks",
+    "reverse_region_a_lo": "rev_ticka_lo",
+    "reverse_region_a_hi": "rev_ticka_hi",
+    "reverse_region_a_t1_ms": "rev_ticka_t1_ms",
+    "reverse_region_a_t2_ms": "rev_ticka_t2_ms",
+    "reverse_region_a_t3_ms": "rev_ticka_t3_ms",
+    "reverse_region_a_on_us": "rev_ticka_on_us",
+    "reverse_region_b_t1_ms": "rev_tickb_t1_ms",
+    "reverse_region_b_t2_ms": "rev_tickb_t2_ms",
+    "reverse_region_b_t3_ms": "rev_tickb_t3_ms",
+    "reverse_region_b_on_us": "rev_tickb_on_us",
+    "reverse_count_mask": "rev_count_mask",
+    "reverse_speedup": "rev_speedup",
+    "diff_threshold_hh": "diff_threshold_hh",
+    "diff_threshold_mm": "diff_threshold_mm",
+    "diff_threshold_ss": "diff_threshold_ss",
+    "drift_tolerance_ss": "drift_tolerance_ss",
+    "rtc_poll_ticks": "rtc_poll_ticks",
+}
+
+# Maximum age of an RTC reading the API extrapolates from instead of re-reading
+RTC_CACHE_TTL = 60
+
+# FRAM I2C address and clock position ring buffer. Each slot holds hour,
+# minute, second, a wrapping sequence number and a CRC-8 of those bytes.
+FRAM_ADDRESS = 0x50
+FRAM_RING_OFFSET = 16
+FRAM_RING_SLOTS = 64
+FRAM_RECORD = struct.Struct("BBBBB")
+FRAM_RECORD_SIZE = FRAM_RECORD.size
+# Write transaction: 2-byte memory address followed by the record minus its CRC
+FRAM_WRITE = struct.Struct("!HBBBB")
+
+
+class DirectGPIO:
+    """Drive output pins through the BCM2835/BCM2711 registers in /dev/gpiomem"""
+
+    GPSET0 = 0x1C // 4
+    GPCLR0 = 0x28 // 4
+    SUPPORTED_SOCS = (
+        b"brcm,bcm2835",
+        b"brcm,bcm2836",
+        b"brcm,bcm2837",
+        b"brcm,bcm2711",
+    )
+
+    def __init__(self):
+        # The Pi 5 (BCM2712/RP1) uses a different register layout
+        with open("/proc/device-tree/compatible", "rb") as f:
+            compatible = f.read().split(b"\0")
+        if not any(soc in compatible for soc in self.SUPPORTED_SOCS):
+            raise OSError("SoC not supported for direct GPIO register access")
+
+        fd = os.open("/dev/gpiomem", os.O_RDWR | os.O_SYNC)
+        try:
+            self.mem = mmap.mmap(fd, mmap.PAGESIZE)
+        finally:
+            os.close(fd)
+        self.registers = memoryview(self.mem).cast("I")
+
+    def high(self, pin):
+        self.registers[self.GPSET0] = 1 << pin
+
+    def low(self, pin):
+        self.registers[self.GPCLR0] = 1 << pin
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _clock_nanosleep = _libc.clock_nanosleep
+    _clock_nanosleep.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.POINTER(_Timespec),
+    ]
+    _clock_nanosleep.restype = ctypes.c_int
+except (OSError, AttributeError, TypeError):
+    _libc = None
+    _clock_nanosleep = None
+
+
+def _set_timer_slack(slack_ns=1):
+    """Reduce the kernel timer slack of the calling thread (Linux only)"""
+    if _libc is None:
+        return
+    try:
+        _libc.prctl(PR_SET_TIMERSLACK, slack_ns, 0, 0, 0)
+    except AttributeError:
+        pass
+
+
+def _lower_thread_priority(nice=BACKGROUND_NICE):
+    """Raise the calling thread's nice value so it yields to the tick loop"""
+    try:
+        tid = threading.get_native_id()
+        current = os.getpriority(os.PRIO_PROCESS, tid)
+        # Threads started from here inherit the new value (Linux only)
+        os.setpriority(os.PRIO_PROCESS, tid, max(current, nice))
+    except (AttributeError, OSError) as e:
+        logging.debug("Could not lower thread priority: %s", e)
+
+
+def _raise_thread_priority(priority=TICK_RT_PRIORITY):
+    """Run the calling thread under SCHED_FIFO so a pulse is not preempted"""
+    try:
+        # Threads started from here inherit the policy (Linux only)
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        logging.info("Ticking with real-time priority %d", priority)
+    except (AttributeError, OSError) as e:
+        logging.info(f"Real-time priority unavailable, ticking at normal priority: {e}")
+
+
+def _lock_memory():
+    """Keep the process resident so a pulse never waits on a page fault"""
+    if _libc is None:
+        return
+    # MCL_ONFAULT locks pages as they are touched instead of populating every
+    # thread stack up front (Linux 4.4+)
+    if _libc.mlockall(MCL_CURRENT | MCL_FUTURE | MCL_ONFAULT) != 0:
+        error = os.strerror(ctypes.get_errno())
+        logging.info(f"Could not lock memory, pages may be swapped out: {error}")
+
+
+def _set_thread_affinity(cpus):
+    """Restrict the calling thread, and threads it starts, to the given CPUs"""
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as e:
+        logging.debug("Could not set thread CPU affinity: %s", e)
+
+
+def _parse_cpu_list(text):
+    """Parse a kernel CPU list such as "1,3-4" into a set of CPU numbers"""
+    cpus = set()
+    for part in text.strip().split(","):
+        if part:
+            first, _, last = part.partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _tick_cpu():
+    """Return the CPU reserved for the tick threads, or None on one core"""
+    # A core isolated with isolcpus= is left out of the default affinity mask,
+    # so it has to be looked up separately
+    try:
+        with open("/sys/devices/system/cpu/isolated") as f:
+            isolated = _parse_cpu_list(f.read())
+    except (OSError, ValueError):
+        isolated = set()
+    if isolated:
+        return max(isolated)
+    try:
+        cpus = os.sched_getaffinity(0)
+    except AttributeError:
+        return None
+    return max(cpus) if len(cpus) > 1 else None
+
+
+def _kernel_receive_time(ancdata):
+    """Receive time from an SO_TIMESTAMPNS control message, else the time now"""
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS:
+            # struct timespec is two longs, 32 or 64 bits depending on the ABI
+            fmt = "@qq" if len(data) >= 16 else "@ll"
+            seconds, nanoseconds = struct.unpack_from(fmt, data)
+            return seconds + nanoseconds / 1_000_000_000
+    return time.time()
+
+
+def _to_ntp_timestamp(timestamp):
+    seconds = int(timestamp)
+    fraction = int((timestamp - seconds) * 2**32)
+    return seconds + NTP_EPOCH_OFFSET, fraction
+
+
+def _from_ntp_timestamp(seconds, fraction):
+    return seconds - NTP_EPOCH_OFFSET + fraction / 2**32
+
+
+# Tick interval in seconds for each fast-forward/reverse count mask
+_COUNT_MASK_INTERVALS = {
+    0: 0.125,  # 8 ticks/sec
+    1: 0.25,  # 4 ticks/sec
+    3: 0.5,  # 2 ticks/sec
+    7: 1.0,  # 1 tick/sec
+}
+
+
+def _count_mask_interval(count_mask):
+    """Tick interval in seconds for a fast-forward/reverse count mask"""
+    return _COUNT_MASK_INTERVALS.get(count_mask, 1.0)
+
+
+def _build_crc8_table(poly=0x07):
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly if crc & 0x80 else crc << 1) & 0xFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC8_TABLE = _build_crc8_table()
+
+
+def _crc8(data):
+    crc = 0
+    for byte in data:
+        crc = _CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def _pack_clock_position(hour, minute, second):
+    return (hour << 16) | (minute << 8) | second
+
+
+def _unpack_clock_position(state):
+    return state >> 16, (state >> 8) & 0xFF, state & 0xFF
+
+
+def _build_tick_tables():
+    """Map every packed dial position to the one a tick forward/back away"""
+    dial = [
+        _pack_clock_position(hour % 12 or 12, minute, second)
+        for hour in range(12)
+        for minute in range(60)
+        for second in range(60)
+    ]
+    forward = {state: dial[(i + 1) % len(dial)] for i, state in enumerate(dial)}
+    backward = {state: dial[i - 1] for i, state in enumerate(dial)}
+    return forward, backward
+
+
+_NEXT_POSITION, _PREV_POSITION = _build_tick_tables()
+
+
+def _bcd_to_int(value):
+    return (value >> 4) * 10 + (value & 0x0F)
+
+
+# Decoded value of every BCD register byte, for the per-tick RTC read
+_BCD_TO_INT = tuple(_bcd_to_int(value) for value in range(256))
+
+
+def _int_to_bcd(value):
+    return ((value // 10) << 4) | (value % 10)
+
+
+def _sleep_until(deadline_ns):
+    """Sleep until an absolute CLOCK_MONOTONIC deadline given in nanoseconds"""
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        while (
+            _clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, ctypes.byref(ts), None)
+            == errno.EINTR
+        ):
+            pass
+        return
+
+    # Fallback for platforms without clock_nanosleep
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1_000_000_000)
+
+
+def _to_us(duration):
+    """Whole microseconds in a duration given in seconds, at least 1"""
+    return max(1, round(duration * 1_000_000))
+
+
+def _next_second_deadline_ns():
+    """CLOCK_MONOTONIC time of the next whole wall-clock second"""
+    return time.monotonic_ns() + 1_000_000_000 - time.time_ns() % 1_000_000_000
+
+
+def _precise_sleep(duration):
+    """Sleep for duration seconds, busy-waiting for short intervals"""
+    duration_ns = int(duration * 1_000_000_000)
+    deadline_ns = time.monotonic_ns() + duration_ns
+    if duration_ns >= BUSY_WAIT_THRESHOLD_NS:
+        # Sleep through most of it, then spin so wake-up latency does not end
+        # up in the pulse width
+        _sleep_until(deadline_ns - BUSY_WAIT_TAIL_NS)
+    while time.monotonic_ns() < deadline_ns:
+        pass
 
 
 class ClockController:
@@ -28,11 +435,19 @@ class ClockController:
 
         # NTP Configuration
         self.ntp_server = "time.nist.gov"
-        self.ntp_sync_interval = 300  # 5 minutes
+        self.ntp_sync_interval = 300  # 5 minutes, the shortest poll interval
+        self.ntp_poll_interval = self.ntp_sync_interval  # Current, after backoff
+        self.ntp_last_offset = None  # Offset of the last accepted sample
+        self.ntp_kissed = False  # Whether the last sync got a Kiss-o'-Death
+        self.ntp_socket = None  # Persistent UDP socket, resolved for ntp_socket_server
+        self.ntp_socket_server = None
+        self.ntp_address = None
+        self.ntp_resolved_at = 0.0
 
         # Flask Configuration
         self.flask_host = "0.0.0.0"
         self.flask_port = 5000
+        self.flask_threads = 4  # Worker threads of the production WSGI server
 
         # Advanced Pulsing Configuration
         # Normal ticking parameters
@@ -46,6 +461,8 @@ class ClockController:
             0  # 0 = 8 ticks/sec, 1 = 4 ticks/sec, 3 = 2 ticks/sec, 7 = 1 tick/sec
         )
         self.fwd_speedup = 8  # Speed multiplier for fast-forward
+        self.fwd_burst_threshold_ss = 60  # Lag (secs) above which to catch up in bursts
+        self.fwd_burst_max_ticks = 60  # Max ticks per burst before re-reading the RTC
 
         # Reverse parameters - Region A (seconds 35-55)
         self.rev_ticka_lo = 35  # REV_TICKA_LO <= second hand < REV_TICKA_HI
@@ -77,6 +494,10 @@ class ClockController:
         # Drift tolerance
         self.drift_tolerance_ss = 2  # Allow up to 2 seconds of drift before correction
 
+        # RTC polling - in steady state the RTC is only read every N ticks
+        self.rtc_poll_ticks = 10
+        self.ticks_since_rtc_read = 0
+
         # Clock state
         self.current_tick_pin = self.tick_pin1
         self.fast_forward = False
@@ -85,24 +506,65 @@ class ClockController:
         self.current_speed = 1  # Current speed multiplier
         self.last_reverse_tick_time = 0  # Track last reverse tick time
 
-        # Clock position
-        self.clock_hour = None
-        self.clock_minute = None
-        self.clock_second = None
+        # Clock position, packed as (hour << 16) | (minute << 8) | second.
+        # Replaced with a single store so readers never need the lock.
+        self.clock_state = None
+
+        # Cached API response bodies
+        self.clock_time_response = (
+            None,
+            _json_dumps({"hour": None, "minute": None, "second": None}),
+            NO_CACHE,
+        )
+        self.clock_status_response = (None, b"")
+        self.current_time_response = (None, b"")
+        self.time_difference_response = (None, b"")
+        self.page_responses = {}  # template -> (render arguments, rendered HTML)
 
         # Threading
-        self.lock = threading.Lock()
         self.clock_position_lock = threading.Lock()
+        self.ntp_lock = threading.Lock()
+        self.ntp_offset_lock = threading.Lock()  # Serialises drift cache refreshes
         self.shutdown_event = threading.Event()
+        # Single wake-up source for the main loop, set on each tick and on shutdown
+        self.tick_event = threading.Event()
+        # RTC writes requested by the web handlers, applied by rtc_writer
+        self.rtc_write_queue = queue.SimpleQueue()
 
         # Hardware initialization
         self.hardware_available = HARDWARE_AVAILABLE
-        self.rtc = None
-        self.fram = None
-        self._init_hardware()
+        self.direct_gpio = None
+        self.pin_high = None  # Callables driving a tick pin, set by _init_hardware
+        self.pin_low = None
+        self.pigpio = None  # pigpio daemon connection for DMA-timed pulses
+        self.pulse_waves = {}  # waveform steps -> pigpio wave id
+        self.wave_deadline_ns = None  # End of the waveform being transmitted
+        self.rtc_device = None
+        self.rtc_read_buf = bytearray(3)  # Seconds, minutes, hours registers
+        self.rtc_cache = (0.0, None)  # (monotonic read time, RTC reading)
+        # (monotonic query time, NTP offset, error from a failed query)
+        self.ntp_offset_cache = (0.0, None, None)
+        self.fram_device = None
+        self.fram_write_buf = bytearray(2 + FRAM_RECORD_SIZE)  # 2-byte address + record
+        self.fram_ring_slot = 0  # Next ring slot to write
+        self.fram_sequence = 0  # Sequence number of the next record
+        self.last_fram_state = None  # Last packed clock position written to FRAM
 
         # Flask app
         self.app = Flask(__name__, static_url_path="/static")
+        # Never run in debug mode, even if FLASK_DEBUG is set in the environment
+        self.app.config.update(
+            DEBUG=False,
+            TEMPLATES_AUTO_RELOAD=False,
+            SEND_FILE_MAX_AGE_DEFAULT=STATIC_MAX_AGE,
+        )
+        if orjson is not None:
+            self.app.json = OrjsonJSONProvider(self.app)
+        else:
+            # Flask 3 replaced the JSON_SORT_KEYS/JSONIFY_PRETTYPRINT_REGULAR
+            # config keys with these provider attributes
+            self.app.json.sort_keys = False
+            self.app.json.compact = True
         self._setup_flask_routes()
 
         # Signal handling
@@ -118,58 +580,214 @@ class ClockController:
             GPIO.output(self.tick_pin1, GPIO.LOW)
             GPIO.output(self.tick_pin2, GPIO.LOW)
 
+            # RPi.GPIO configures the pins; pulses then go straight to the registers
+            try:
+                self.direct_gpio = DirectGPIO()
+                self.pin_high = self.direct_gpio.high
+                self.pin_low = self.direct_gpio.low
+                logging.info("Using direct GPIO register access for pulses")
+            except OSError as e:
+                logging.info(f"Direct GPIO register access unavailable: {e}")
+                self.pin_high = lambda pin: GPIO.output(pin, GPIO.HIGH)
+                self.pin_low = lambda pin: GPIO.output(pin, GPIO.LOW)
+
+            # With the pigpio daemon running, pulse widths are timed by DMA
+            if pigpio is not None:
+                pi = pigpio.pi()
+                if pi.connected:
+                    pi.set_mode(self.tick_pin1, pigpio.OUTPUT)
+                    pi.set_mode(self.tick_pin2, pigpio.OUTPUT)
+                    self.pigpio = pi
+                    logging.info("Using pigpio waveforms for pulses")
+                else:
+                    logging.info("pigpio daemon not running, timing pulses in software")
+
             try:
                 i2c = board.I2C()
-                self.rtc = adafruit_ds3231.DS3231(i2c)
-                self.fram = adafruit_fram.FRAM_I2C(i2c)
+                self.rtc_device = I2CDevice(i2c, DS3231_ADDRESS)
+                self.fram_device = I2CDevice(i2c, FRAM_ADDRESS)
                 logging.info("I2C devices initialized successfully")
             except Exception as e:
                 logging.error(f"Failed to initialize I2C devices: {e}")
                 logging.error("Hardware operations will fail")
                 self.hardware_available = False
-                self.rtc = None
-                self.fram = None
+                self.rtc_device = None
+                self.fram_device = None
 
     def set_rtc_time(self, time_data):
-        if not self.hardware_available or not self.rtc:
+        if not self.hardware_available or not self.rtc_device:
             logging.error("Cannot set RTC time - hardware not available")
             return
         try:
-            self.rtc.datetime = time_data.timetuple()
-        except Exception as e:
+            # Registers 0x00-0x06 in one burst, hours in 24-hour mode
+            month = _int_to_bcd(time_data.month)
+            if time_data.year >= 2100:
+                month |= 0x80  # Century bit
+            buf = bytes(
+                (
+                    DS3231_REG_SECONDS[0],
+                    _int_to_bcd(time_data.second),
+                    _int_to_bcd(time_data.minute),
+                    _int_to_bcd(time_data.hour),
+                    time_data.weekday() + 1,
+                    _int_to_bcd(time_data.day),
+                    month,
+                    _int_to_bcd(time_data.year % 100),
+                )
+            )
+            control = bytearray(2)
+            with self.rtc_device as device:
+                device.write(buf)
+                # Keep the oscillator running on battery and clear the
+                # oscillator-stopped flag, as the adafruit_ds3231 setter did
+                device.write_then_readinto(DS3231_REG_CONTROL, control)
+                if control[0] & DS3231_EOSC or control[1] & DS3231_OSF:
+                    device.write(
+                        bytes(
+                            (
+                                DS3231_REG_CONTROL[0],
+                                control[0] & ~DS3231_EOSC,
+                                control[1] & ~DS3231_OSF,
+                            )
+                        )
+                    )
+            # The value just written is a fresh reading for the API cache
+            self.rtc_cache = (
+                time.monotonic(),
+                (time_data.hour, time_data.minute, time_data.second),
+            )
+        except OSError as e:
             logging.error(f"Failed to set RTC time: {e}")
 
     def get_rtc_time(self) -> Optional[Tuple[int, int, int]]:
-        if not self.hardware_available or not self.rtc:
+        if not self.hardware_available or not self.rtc_device:
             logging.error("Cannot get RTC time - hardware not available")
             return None
         try:
-            rtc_time = self.rtc.datetime
-            return rtc_time.tm_hour, rtc_time.tm_min, rtc_time.tm_sec
-        except Exception as e:
+            # Single burst read of the seconds, minutes and hours registers,
+            # decoded while the bus lock still guards the shared buffer
+            buf = self.rtc_read_buf
+            with self.rtc_device as device:
+                device.write_then_readinto(DS3231_REG_SECONDS, buf)
+                second = _BCD_TO_INT[buf[0] & 0x7F]
+                minute = _BCD_TO_INT[buf[1] & 0x7F]
+                hours = buf[2]
+            if hours & 0x40:
+                # 12-hour mode, bit 5 is the PM flag
+                hour = _BCD_TO_INT[hours & 0x1F] % 12 + (12 if hours & 0x20 else 0)
+            else:
+                hour = _BCD_TO_INT[hours & 0x3F]
+            return hour, minute, second
+        except OSError as e:
             logging.error(f"Failed to get RTC time: {e}")
             return None
 
+    def get_cached_rtc_time(self) -> Optional[Tuple[int, int, int]]:
+        """RTC time extrapolated from a reading taken within RTC_CACHE_TTL"""
+        now = time.monotonic()
+        read_time, rtc_time = self.rtc_cache
+        if rtc_time is not None and now - read_time < RTC_CACHE_TTL:
+            # The DS3231 and the monotonic clock drift apart by far less than a
+            # second in a minute, so counting on from the last reading does not
+            # need an I2C transaction
+            hour, minute, second = rtc_time
+            seconds = hour * 3600 + minute * 60 + second + int(now - read_time)
+            seconds %= 86400
+            hour, seconds = divmod(seconds, 3600)
+            return (hour, *divmod(seconds, 60))
+        if self.shutdown_event.is_set():
+            # The bus is about to be released by _shutdown
+            return None
+        rtc_time = self.get_rtc_time()
+        self.rtc_cache = (now, rtc_time)
+        return rtc_time
+
+    def fram_read(self, address, length) -> bytearray:
+        """Read a block of FRAM in a single I2C transaction"""
+        buf = bytearray(length)
+        with self.fram_device as device:
+            device.write_then_readinto(address.to_bytes(2, "big"), buf)
+        return buf
+
     def write_time_to_fram(self):
-        if not self.hardware_available or not self.fram:
+        if not self.hardware_available or not self.fram_device:
             logging.error("Cannot write to FRAM - hardware not available")
             return
         try:
-            with self.clock_position_lock:
-                time_string = f"{self.clock_hour:02}:{self.clock_minute:02}:{self.clock_second:02}"
-            self.fram[0:8] = bytearray(time_string.encode("utf-8"))
-            logging.info(f"Wrote clock time '{time_string}' to FRAM.")
-        except Exception as e:
+            # Compare the packed position directly, so an unchanged tick
+            # (e.g. while paused) costs no allocation and no I2C transaction
+            state = self.clock_state
+            if state == self.last_fram_state:
+                return
+
+            # Each write goes to the next ring slot, so a write torn by a power
+            # loss only costs the newest record
+            address = FRAM_RING_OFFSET + self.fram_ring_slot * FRAM_RECORD_SIZE
+            buf = self.fram_write_buf
+            FRAM_WRITE.pack_into(
+                buf,
+                0,
+                address,
+                state >> 16,
+                (state >> 8) & 0xFF,
+                state & 0xFF,
+                self.fram_sequence,
+            )
+            buf[6] = _crc8(buf[2:6])
+            with self.fram_device as device:
+                device.write(buf)
+
+            self.fram_ring_slot = (self.fram_ring_slot + 1) % FRAM_RING_SLOTS
+            self.fram_sequence = (self.fram_sequence + 1) & 0xFF
+            self.last_fram_state = state
+            logging.debug("Wrote clock time '%02d:%02d:%02d' to FRAM.", *buf[2:5])
+        except OSError as e:
             logging.error(f"Failed to write time to FRAM: {e}")
 
-    def read_time_from_fram(self) -> Optional[str]:
-        if not self.hardware_available or not self.fram:
+    def _newest_fram_record(self, ring):
+        """Return (slot, record) of the most recent valid ring entry, if any"""
+        records = {}
+        for slot, record in enumerate(FRAM_RECORD.iter_unpack(ring)):
+            if (
+                _crc8(record[:4]) == record[4]
+                and 1 <= record[0] <= 12
+                and record[1] <= 59
+                and record[2] <= 59
+            ):
+                records[record[3]] = (slot, record)
+
+        # The newest record is one whose successor sequence number is missing.
+        # If a damaged slot leaves several, take the one furthest ahead.
+        newest = None
+        for sequence in records:
+            if (sequence + 1) & 0xFF in records:
+                continue
+            if newest is None or (sequence - newest) & 0xFF < 128:
+                newest = sequence
+        return None if newest is None else records[newest]
+
+    def read_time_from_fram(self) -> Optional[Tuple[int, int, int]]:
+        if not self.hardware_available or not self.fram_device:
             logging.error("Cannot read from FRAM - hardware not available")
             return None
         try:
-            time_bytes = self.fram[0:8]
-            time_string = time_bytes.decode("utf-8")
+            ring = self.fram_read(
+                FRAM_RING_OFFSET, FRAM_RING_SLOTS * FRAM_RECORD_SIZE
+            )
+            newest = self._newest_fram_record(ring)
+            if newest is not None:
+                slot, record = newest
+                hour, minute, second, sequence = record[:4]
+                # Continue the ring after the record just read
+                self.fram_ring_slot = (slot + 1) % FRAM_RING_SLOTS
+                self.fram_sequence = (sequence + 1) & 0xFF
+                logging.info(
+                    f"Read time from FRAM ring slot {slot}: {hour:02}:{minute:02}:{second:02}"
+                )
+                return hour, minute, second
 
+            # Fall back to the legacy "HH:MM:SS" ASCII record at address 0
+            time_string = bytes(self.fram_read(0, 8)).decode("utf-8")
             if len(time_string) != 8 or time_string[2] != ":" or time_string[5] != ":":
                 logging.warning(f"Invalid time format in FRAM: {time_string}")
                 return None
@@ -184,11 +802,24 @@ class ClockController:
                 return None
 
             logging.info(f"Read time from FRAM at address 0: {time_string}")
-            return time_string
-        except Exception as e:
+            return hour, minute, second
+        except (OSError, ValueError) as e:
             logging.error(f"Failed to read time from FRAM: {e}")
             return None
 
+    def rtc_writer(self):
+        """Apply RTC writes queued from the web UI, so requests never wait on I2C"""
+        _lower_thread_priority()
+        while True:
+            time_data = self.rtc_write_queue.get()
+            if time_data is None:
+                break
+            # One bad write must not stop the ones queued after it
+            try:
+                self.set_rtc_time(time_data)
+            except Exception as e:
+                logging.error(f"Failed to apply queued RTC write: {e}")
+
     def sync_rtc_time_with_ntp_time(self, on_startup=False):
         try:
             ntp_time = self.get_ntp_time()
@@ -200,46 +831,284 @@ class ClockController:
             logging.error(f"Failed to sync RTC time with NTP time: {e}")
 
     def continuous_sync_rtc_time_with_ntp_time(self):
+        # Syncs are scheduled from a monotonic anchor, so the time spent in the
+        # NTP exchange does not stretch the interval
+        next_sync = time.monotonic()
+        poll_shift = 0
+        last_offset = None
         while not self.shutdown_event.is_set():
-            self.sync_rtc_time_with_ntp_time()
-            sync_interval = max(1, self.ntp_sync_interval)
-            for _ in range(sync_interval):
-                if self.shutdown_event.is_set():
-                    break
-                time.sleep(1)
+            ntp_time = self.get_ntp_time()
+            offset = self.ntp_last_offset if ntp_time else None
+            if ntp_time and not self.shutdown_event.is_set():
+                # Written from here rather than queued to the low-priority
+                # writer, so it lands within the second get_ntp_time aligned
+                # to. I2CDevice serialises the bus with the other writers.
+                self.set_rtc_time(ntp_time)
+
+            # Like NTP's poll exponent: double the interval while successive
+            # offsets agree, and drop back to ntp_sync_interval when they do not.
+            # A kiss code (e.g. RATE) backs off further, as RFC 5905 asks,
+            # and other failures leave the interval as it was.
+            min_interval = max(1, self.ntp_sync_interval)
+            if offset is not None:
+                if last_offset is not None:
+                    if abs(offset - last_offset) < NTP_STABLE_OFFSET_STEP:
+                        if min_interval << poll_shift < NTP_MAX_POLL_INTERVAL:
+                            poll_shift += 1
+                    else:
+                        poll_shift = 0
+                last_offset = offset
+            elif self.ntp_kissed:
+                if min_interval << poll_shift < NTP_MAX_POLL_INTERVAL:
+                    poll_shift += 1
+            self.ntp_poll_interval = max(
+                min_interval, min(min_interval << poll_shift, NTP_MAX_POLL_INTERVAL)
+            )
+            next_sync = max(next_sync + self.ntp_poll_interval, time.monotonic())
+            # One wait per interval, returning early on shutdown
+            if self.shutdown_event.wait(next_sync - time.monotonic()):
+                break
+
+    def _close_ntp_socket(self):
+        if self.ntp_socket is not None:
+            self.ntp_socket.close()
+        self.ntp_socket = None
+        self.ntp_socket_server = None
+        self.ntp_address = None
+
+    def _get_ntp_socket(self):
+        """Return the NTP socket, re-resolving the server name after NTP_RESOLVE_TTL"""
+        ntp_server = self.ntp_server
+        now = time.monotonic()
+        if (
+            self.ntp_socket is not None
+            and self.ntp_socket_server == ntp_server
+            and now - self.ntp_resolved_at < NTP_RESOLVE_TTL
+        ):
+            return self.ntp_socket
+
+        family, sock_type, proto, _, address = socket.getaddrinfo(
+            ntp_server, NTP_PORT, type=socket.SOCK_DGRAM
+        )[0]
+        # Keep the existing socket when only the address changed
+        if self.ntp_socket is None or self.ntp_socket.family != family:
+            self._close_ntp_socket()
+            self.ntp_socket = socket.socket(family, sock_type, proto)
+            # Stamp replies on arrival in the kernel, not when this thread wakes
+            try:
+                self.ntp_socket.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            except OSError as e:
+                logging.debug("Kernel receive timestamps unavailable: %s", e)
+        self.ntp_socket_server = ntp_server
+        self.ntp_address = address
+        self.ntp_resolved_at = now
+        return self.ntp_socket
+
+    def ntp_request(self) -> Tuple[float, float]:
+        """Query the NTP server, returning (clock offset, round-trip delay)"""
+        with self.ntp_lock:
+            try:
+                ntp_socket = self._get_ntp_socket()
+                packet = bytearray(NTP_PACKET.size)
+                packet[0] = NTP_CLIENT_MODE
+                originate = _to_ntp_timestamp(time.time())
+                struct.pack_into("!II", packet, NTP_TRANSMIT_OFFSET, *originate)
+                ntp_socket.sendto(packet, self.ntp_address)
+
+                # Wait in short slices so a pending request never delays shutdown
+                deadline = time.monotonic() + NTP_TIMEOUT
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("NTP request timed out")
+                    if self.shutdown_event.is_set():
+                        raise InterruptedError("NTP request aborted by shutdown")
+                    readable, _, _ = select.select(
+                        [ntp_socket], [], [], min(remaining, NTP_POLL_INTERVAL)
+                    )
+                    if not readable:
+                        continue
+                    data, ancdata, _, _ = ntp_socket.recvmsg(
+                        NTP_PACKET.size, NTP_ANCILLARY_SIZE
+                    )
+                    destination_time = _kernel_receive_time(ancdata)
+                    fields = NTP_PACKET.unpack(data[: NTP_PACKET.size])
+                    # Ignore late replies to earlier requests on this socket
+                    if (fields[9], fields[10]) == originate:
+                        break
+
+                if fields[1] == 0:
+                    # Kiss-o'-Death: the reference ID carries the kiss code.
+                    # Failing here also drops the socket, so the name is
+                    # resolved again and a pool hands out another server.
+                    kiss_code = data[12:16].decode("ascii", "replace")
+                    raise ConnectionRefusedError(
+                        f"NTP server sent kiss code {kiss_code}"
+                    )
+                if fields[0] >> 6 == NTP_LEAP_ALARM:
+                    raise ValueError("NTP server clock is not synchronized")
+            except Exception:
+                self._close_ntp_socket()
+                raise
+
+        originate_time = _from_ntp_timestamp(*originate)
+        receive_time = _from_ntp_timestamp(fields[11], fields[12])
+        transmit_time = _from_ntp_timestamp(fields[13], fields[14])
+        offset = (
+            (receive_time - originate_time) + (transmit_time - destination_time)
+        ) / 2
+        delay = (destination_time - originate_time) - (transmit_time - receive_time)
+        return offset, delay
 
     def get_ntp_time(self) -> Optional[datetime]:
+        # Like NTP's clock filter: of a few back-to-back samples, the one with
+        # the shortest round trip has the least asymmetric queueing in its offset
+        samples = []
+        error = None
+        self.ntp_kissed = False
+        for _ in range(NTP_SAMPLES):
+            try:
+                samples.append(self.ntp_request())
+            except (ConnectionRefusedError, InterruptedError) as e:
+                # Kiss-o'-Death or shutdown, do not query again now
+                self.ntp_kissed = isinstance(e, ConnectionRefusedError)
+                error = e
+                break
+            except Exception as e:
+                error = e
+        if not samples:
+            logging.error(f"Failed to get NTP time: {error}")
+            return None
+
         try:
-            ntp_client = ntplib.NTPClient()
-            ntp_response = ntp_client.request(self.ntp_server, version=3, port=123)
-            return datetime.fromtimestamp(ntp_response.tx_time)
+            offset, delay = min(samples, key=lambda sample: sample[1])
+            if delay > NTP_MAX_DELAY:
+                logging.warning(
+                    f"Rejected NTP sample with {delay:.3f}s round-trip delay"
+                )
+                return None
+            # Apply the offset to local time so network latency is not baked in,
+            # and return on a whole second: writing the DS3231 seconds register
+            # restarts its countdown, so this keeps the RTC in phase as well
+            self.ntp_last_offset = offset
+            self.ntp_offset_cache = (time.monotonic(), offset, None)
+            now = time.time() + offset
+            _precise_sleep(1 - now % 1)
+            return datetime.fromtimestamp(round(time.time() + offset))
         except Exception as e:
             logging.error(f"Failed to get NTP time: {e}")
             return None
 
+    def _fresh_ntp_offset(self) -> Optional[float]:
+        """Cached NTP offset if still within NTP_DRIFT_CACHE_TTL, else None"""
+        query_time, offset, error = self.ntp_offset_cache
+        if time.monotonic() - query_time >= NTP_DRIFT_CACHE_TTL:
+            return None
+        # Failures are cached too, so a timeout or a RATE kiss is not
+        # answered with a fresh query on every poll
+        if error is not None:
+            raise error
+        return offset
+
+    def get_cached_ntp_offset(self) -> float:
+        """NTP clock offset, re-queried at most once per NTP_DRIFT_CACHE_TTL"""
+        offset = self._fresh_ntp_offset()
+        if offset is not None:
+            return offset
+        # Only one request refreshes an expired entry; the others wait here
+        # and then reuse its result
+        with self.ntp_offset_lock:
+            offset = self._fresh_ntp_offset()
+            if offset is not None:
+                return offset
+            now = time.monotonic()
+            try:
+                offset, _ = self.ntp_request()
+            except Exception as e:
+                self.ntp_offset_cache = (now, None, e)
+                raise
+            self.ntp_offset_cache = (now, offset, None)
+            return offset
+
     def send_pulse(self, pin, duration, next_tick_delay=0):
         if not self.hardware_available:
             logging.error("Cannot send GPIO pulse - hardware not available")
             return
 
         try:
-            GPIO.output(pin, GPIO.HIGH)
-            time.sleep(duration)
-            GPIO.output(pin, GPIO.LOW)
-            time.sleep(next_tick_delay)
+            if self.pigpio is not None:
+                self._send_waveform(((pin, _to_us(duration), 0),))
+            else:
+                self.pin_high(pin)
+                _precise_sleep(duration)
+                self.pin_low(pin)
+            _precise_sleep(next_tick_delay)
         except Exception as e:
             logging.error(f"GPIO operation failed for pin {pin}: {e}")
 
-    def send_pwm_pulse(self, pin, total_duration, on_duration_us):
-        """Send a pulse with precise timing control"""
+    def _start_waveform(self, steps):
+        """Start (pin, high_us, low_us) steps as one DMA-timed pigpio waveform"""
+        pi = self.pigpio
+        # A new waveform would cut short the one still being transmitted
+        self.finish_pulse()
+        wave_id = self.pulse_waves.get(steps)
+        if wave_id is None:
+            # Waveforms are rebuilt only when the pulsing config changes
+            if len(self.pulse_waves) >= PIGPIO_MAX_WAVES:
+                pi.wave_clear()
+                self.pulse_waves.clear()
+            pulses = []
+            for pin, high_us, low_us in steps:
+                pulses.append(pigpio.pulse(1 << pin, 0, high_us))
+                pulses.append(pigpio.pulse(0, 1 << pin, low_us))
+            pi.wave_add_generic(pulses)
+            wave_id = pi.wave_create()
+            self.pulse_waves[steps] = wave_id
+
+        pi.wave_send_once(wave_id)
+        self.wave_deadline_ns = time.monotonic_ns() + 1000 * sum(
+            high + low for _, high, low in steps
+        )
+
+    def _send_waveform(self, steps):
+        """Play a pigpio waveform and wait for it to finish"""
+        self._start_waveform(steps)
+        self.finish_pulse()
+
+    def finish_pulse(self):
+        """Wait for a waveform left running by send_pwm_pulse(wait=False)"""
+        if self.wave_deadline_ns is None:
+            return
+        # Timing is set by the waveform, so sleeping here only frees the CPU
+        _sleep_until(self.wave_deadline_ns)
+        self.wave_deadline_ns = None
+        try:
+            while self.pigpio.wave_tx_busy():
+                _precise_sleep(0.0001)
+        except Exception as e:
+            logging.error(f"Failed to wait for pulse waveform: {e}")
+
+    def send_pwm_pulse(self, pin, total_duration, on_duration_us, wait=True):
+        """Send a pulse with precise timing control
+
+        With wait=False a DMA-timed pulse is left running so the caller can
+        overlap other work with it; finish_pulse() waits for it to end.
+        Software-timed pulses always complete here, since a stalled I2C
+        transfer in between would stretch them.
+        """
         if not self.hardware_available:
             logging.error("Cannot send pulse - hardware not available")
             return
 
         try:
-            GPIO.output(pin, GPIO.HIGH)
-            time.sleep(total_duration)
-            GPIO.output(pin, GPIO.LOW)
+            if self.pigpio is not None:
+                self._start_waveform(((pin, _to_us(total_duration), 0),))
+                if wait:
+                    self.finish_pulse()
+            else:
+                self.pin_high(pin)
+                _precise_sleep(total_duration)
+                self.pin_low(pin)
 
         except Exception as e:
             logging.error(f"Pulse operation failed for pin {pin}: {e}")
@@ -251,7 +1120,9 @@ class ClockController:
 
         # Use normal tick parameters
         duration = self.norm_tick_ms / 1000.0
-        self.send_pwm_pulse(self.current_tick_pin, duration, self.norm_tick_on_us)
+        self.send_pwm_pulse(
+            self.current_tick_pin, duration, self.norm_tick_on_us, wait=False
+        )
 
         # Switch pins
         self.current_tick_pin = (
@@ -268,7 +1139,9 @@ class ClockController:
 
         # Use fast-forward tick parameters
         duration = self.fwd_tick_ms / 1000.0
-        self.send_pwm_pulse(self.current_tick_pin, duration, self.fwd_tick_on_us)
+        self.send_pwm_pulse(
+            self.current_tick_pin, duration, self.fwd_tick_on_us, wait=False
+        )
 
         # Switch pins
         self.current_tick_pin = (
@@ -278,6 +1151,68 @@ class ClockController:
         )
         self.update_clock_position()
 
+    def fast_forward_burst(self, count):
+        """Emit up to count fast-forward ticks back to back at the fast-forward rate"""
+        interval = _count_mask_interval(self.fwd_count_mask)
+        if self.pigpio is not None:
+            self._fast_forward_wave(count, interval)
+            return
+
+        interval_ns = int(interval * 1_000_000_000)
+        deadline_ns = time.monotonic_ns()
+        for _ in range(count):
+            if self.shutdown_event.is_set() or self.paused:
+                break
+            self.fast_forward_tick()
+            # Persist each tick, so a power loss mid-burst leaves FRAM at
+            # most one tick behind the hands
+            self.write_time_to_fram()
+            deadline_ns += interval_ns
+            _sleep_until(deadline_ns)
+
+    def _fast_forward_wave(self, count, interval):
+        """Emit a fast-forward burst as one chained pigpio waveform"""
+        self.reverse = False
+        self.current_speed = self.fwd_speedup
+
+        high_us = _to_us(self.fwd_tick_ms / 1000.0)
+        low_us = max(1, _to_us(interval) - high_us)
+        pin = self.current_tick_pin
+        other_pin = self.tick_pin2 if pin == self.tick_pin1 else self.tick_pin1
+        steps = []
+        for _ in range(count):
+            steps.append((pin, high_us, low_us))
+            pin, other_pin = other_pin, pin
+
+        try:
+            self._start_waveform(tuple(steps))
+        except Exception as e:
+            logging.error(f"Fast-forward waveform failed: {e}")
+            return
+
+        # Publish and persist each tick once its pulse has ended, so FRAM never
+        # runs ahead of the hands while the rest of the burst is still queued
+        step_ns = 1000 * (high_us + low_us)
+        tick_end_ns = self.wave_deadline_ns - count * step_ns + 1000 * high_us
+        for emitted in range(1, count + 1):
+            _sleep_until(tick_end_ns)
+            self.current_tick_pin = (
+                self.tick_pin2
+                if self.current_tick_pin == self.tick_pin1
+                else self.tick_pin1
+            )
+            self.update_clock_position()
+            self.write_time_to_fram()
+            tick_end_ns += step_ns
+            if emitted < count and (self.shutdown_event.is_set() or self.paused):
+                # Stop in the gap after a pulse, like the software burst does
+                try:
+                    self.pigpio.wave_tx_stop()
+                except Exception as e:
+                    logging.error(f"Failed to stop fast-forward waveform: {e}")
+                self.wave_deadline_ns = None
+                break
+
     def reverse_tick(self):
         """Reverse tick with region-specific parameters"""
         # Ensure adequate spacing between reverse ticks
@@ -295,8 +1230,7 @@ class ClockController:
         # Add a small delay to ensure consistent timing
         time.sleep(0.005)  # 5ms delay for timing consistency
 
-        with self.clock_position_lock:
-            current_second = self.clock_second
+        current_second = self.get_clock_position()[2]
 
         # Determine which region we're in for reverse parameters
         if self.rev_ticka_lo <= current_second < self.rev_ticka_hi:
@@ -315,61 +1249,67 @@ class ClockController:
             region = "B"
 
         logging.debug(
-            f"Reverse tick - Region {region}, Pin {self.current_tick_pin}, t1={t1_duration * 1000:.1f}ms, t2={t2_duration * 1000:.1f}ms, t3={t3_duration * 1000:.1f}ms"
+            "Reverse tick - Region %s, Pin %d, t1=%.1fms, t2=%.1fms, t3=%.1fms",
+            region,
+            self.current_tick_pin,
+            t1_duration * 1000,
+            t2_duration * 1000,
+            t3_duration * 1000,
         )
 
-        # Two-pulse reverse sequence with improved timing
-        # First pulse (short) - release
-        self.send_pwm_pulse(self.current_tick_pin, t1_duration, on_us)
-
-        # Ensure first pulse is completely finished before switching pins
-        time.sleep(0.001)  # 1ms delay to ensure pulse completion
-
-        # Switch pins
         old_pin = self.current_tick_pin
-        self.current_tick_pin = (
-            self.tick_pin1
-            if self.current_tick_pin == self.tick_pin2
-            else self.tick_pin2
-        )
-        logging.debug(
-            f"Reverse tick - Switched from pin {old_pin} to pin {self.current_tick_pin}"
-        )
+        new_pin = self.tick_pin1 if old_pin == self.tick_pin2 else self.tick_pin2
 
-        # Delay before second pulse (with additional small delay for pin settling)
-        time.sleep(t2_duration + 0.002)  # Add 2ms for pin settling
-
-        # Second pulse (long) - engage
-        self.send_pwm_pulse(self.current_tick_pin, t3_duration, on_us)
+        if self.pigpio is not None:
+            # The whole release/engage sequence, gaps included, as one waveform
+            try:
+                self._send_waveform(
+                    (
+                        (old_pin, _to_us(t1_duration), _to_us(t2_duration + 0.003)),
+                        (new_pin, _to_us(t3_duration), 1000),
+                    )
+                )
+            except Exception as e:
+                logging.error(
+                    f"Reverse waveform failed on pins {old_pin}/{new_pin}: {e}"
+                )
+            self.current_tick_pin = new_pin
+        else:
+            # Two-pulse reverse sequence with improved timing
+            # First pulse (short) - release
+            self.send_pwm_pulse(old_pin, t1_duration, on_us)
 
-        # Ensure second pulse is completely finished before continuing
-        time.sleep(0.001)  # 1ms delay to ensure pulse completion
+            # The gap is one deadline from the end of the first pulse: t2 plus
+            # 1ms for pulse completion and 2ms for pin settling, so oversleeping
+            # in one part cannot stretch the whole gap
+            gap_end = time.monotonic() + t2_duration + 0.003
 
-        self.update_clock_position(reverse=True)
+            # Switch pins
+            self.current_tick_pin = new_pin
 
-    def calculate_time_difference(self, ntp_hour, ntp_minute, ntp_second):
-        with self.clock_position_lock:
-            clock_hour = self.clock_hour
-            clock_minute = self.clock_minute
-            clock_second = self.clock_second
+            _precise_sleep(gap_end - time.monotonic())
 
-        ntp_total_seconds = ntp_hour * 3600 + ntp_minute * 60 + ntp_second
+            # Second pulse (long) - engage
+            self.send_pwm_pulse(new_pin, t3_duration, on_us)
 
-        clock_hour_24 = clock_hour
-        if clock_hour == 12:
-            clock_hour_24 = 0 if ntp_hour < 12 else 12
-        elif ntp_hour >= 12:
-            clock_hour_24 = clock_hour + 12
+            # Ensure second pulse is completely finished before continuing
+            time.sleep(0.001)  # 1ms delay to ensure pulse completion
 
-        clock_total_seconds = clock_hour_24 * 3600 + clock_minute * 60 + clock_second
-        total_seconds_diff = ntp_total_seconds - clock_total_seconds
+        logging.debug("Reverse tick - Switched from pin %d to pin %d", old_pin, new_pin)
 
-        if total_seconds_diff > 21600:
-            total_seconds_diff -= 43200
-        elif total_seconds_diff < -21600:
-            total_seconds_diff += 43200
+        self.update_clock_position(reverse=True)
 
-        return total_seconds_diff
+    def calculate_time_difference(self, ntp_hour, ntp_minute, ntp_second):
+        clock_hour, clock_minute, clock_second = self.get_clock_position()
+
+        # Both sides reduced to seconds on the 12-hour dial, then the difference
+        # is wrapped into (-6h, 6h] so the shorter way round is chosen. At
+        # exactly 6h fast-forward wins, as it is much quicker than reversing.
+        ntp_total_seconds = (ntp_hour % 12) * 3600 + ntp_minute * 60 + ntp_second
+        clock_total_seconds = (
+            (clock_hour % 12) * 3600 + clock_minute * 60 + clock_second
+        )
+        return (ntp_total_seconds - clock_total_seconds + 21599) % 43200 - 21599
 
     def should_use_fast_forward_or_reverse(self, total_seconds_diff):
         """Threshold checking for fast-forward/reverse decisions with drift tolerance"""
@@ -394,107 +1334,156 @@ class ClockController:
 
         return False
 
+    def get_clock_position(self):
+        """Return a consistent (hour, minute, second) snapshot without locking"""
+        state = self.clock_state
+        if state is None:
+            return None, None, None
+        return _unpack_clock_position(state)
+
+    def set_clock_position(self, hour, minute, second):
+        with self.clock_position_lock:
+            self.clock_state = _pack_clock_position(hour, minute, second)
+        # Compare against the RTC on the next tick
+        self.ticks_since_rtc_read = self.rtc_poll_ticks
+
     def update_clock_position(self, reverse=False):
+        # The lock only serialises writers; readers use get_clock_position
         with self.clock_position_lock:
-            if reverse:
-                self.clock_second = (self.clock_second - 1) % 60
-                if self.clock_second == 59:
-                    self.clock_minute = (self.clock_minute - 1) % 60
-                    if self.clock_minute == 59:
-                        self.clock_hour = (self.clock_hour - 1) % 12
-                        if self.clock_hour == 0:
-                            self.clock_hour = 12
-            else:
-                self.clock_second = (self.clock_second + 1) % 60
-                if self.clock_second == 0:
-                    self.clock_minute = (self.clock_minute + 1) % 60
-                    if self.clock_minute == 0:
-                        self.clock_hour = (self.clock_hour + 1) % 12
-                        if self.clock_hour == 0:
-                            self.clock_hour = 12
+            table = _PREV_POSITION if reverse else _NEXT_POSITION
+            self.clock_state = table[self.clock_state]
 
     def synchronize_clock(self):
+        # While in sync the hand position is tracked locally between RTC reads,
+        # once it is known at all (FRAM may be blank, or there is no hardware)
+        if (
+            self.clock_state is not None
+            and not self.fast_forward
+            and not self.reverse
+            and self.ticks_since_rtc_read + 1 < self.rtc_poll_ticks
+        ):
+            self.ticks_since_rtc_read += 1
+            self.forward_tick()
+            return
+        self.ticks_since_rtc_read = 0
+
         rtc_time = self.get_rtc_time()
+        # Share the reading with /api/current_time and /api/time_difference
+        self.rtc_cache = (time.monotonic(), rtc_time)
         if not rtc_time:
             return
 
         hour, minute, second = rtc_time
         total_seconds_diff = self.calculate_time_difference(hour, minute, second)
 
-        logging.info(f"RTC time: {hour:02}:{minute:02}:{second:02}")
-        logging.info(
-            f"Clock time: {self.clock_hour:02}:{self.clock_minute:02}:{self.clock_second:02}"
-        )
-        logging.info(f"Time difference: {total_seconds_diff} seconds")
+        # Per-tick details are logged at DEBUG, mode changes at INFO. Check the
+        # level once so the common case does not even build the arguments.
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("RTC time: %02d:%02d:%02d", hour, minute, second)
+            logging.debug("Clock time: %02d:%02d:%02d", *self.get_clock_position())
+            logging.debug("Time difference: %d seconds", total_seconds_diff)
 
         # Synchronization logic
         if not self.should_use_fast_forward_or_reverse(total_seconds_diff):
             # Within tolerance - normal ticking
-            if abs(total_seconds_diff) <= self.drift_tolerance_ss:
-                logging.info(
-                    f"Clock is within drift tolerance ({self.drift_tolerance_ss}s) - normal ticking"
+            if self.fast_forward or self.reverse:
+                logging.info("Clock caught up with RTC time - normal ticking")
+            elif abs(total_seconds_diff) <= self.drift_tolerance_ss:
+                logging.debug(
+                    "Clock is within drift tolerance (%ds) - normal ticking",
+                    self.drift_tolerance_ss,
                 )
             else:
-                logging.info(
-                    f"Clock is within threshold tolerance ({self.diff_threshold_ss}s) - normal ticking"
+                logging.debug(
+                    "Clock is within threshold tolerance (%ds) - normal ticking",
+                    self.diff_threshold_ss,
                 )
             self.fast_forward = False
             self.forward_tick()
         elif total_seconds_diff > 0:
             # Clock is behind - fast forward
-            logging.info(
-                f"Clock is behind RTC time by {total_seconds_diff} seconds - fast forwarding"
+            logging.log(
+                logging.DEBUG if self.fast_forward else logging.INFO,
+                "Clock is behind RTC time by %d seconds - fast forwarding",
+                total_seconds_diff,
             )
             self.fast_forward = True
-            self.fast_forward_tick()
+            if total_seconds_diff > self.fwd_burst_threshold_ss:
+                self.fast_forward_burst(
+                    min(total_seconds_diff, self.fwd_burst_max_ticks)
+                )
+            else:
+                self.fast_forward_tick()
         else:
             # Clock is ahead - reverse
-            logging.info(
-                f"Clock is ahead of RTC time by {abs(total_seconds_diff)} seconds - reversing"
+            logging.log(
+                logging.DEBUG if self.reverse else logging.INFO,
+                "Clock is ahead of RTC time by %d seconds - reversing",
+                -total_seconds_diff,
             )
             self.fast_forward = False
             self.reverse_tick()
 
     def timer_callback(self, tick_event):
+        _set_timer_slack()
+        # Absolute deadline so wake-up latency does not accumulate across ticks,
+        # starting on a whole wall-clock second so ticks stay in phase with it
+        deadline_ns = _next_second_deadline_ns()
+        last_interval = 1.0
         while not self.shutdown_event.is_set():
             # Speed-based timing
             if self.fast_forward:
-                # Fast-forward timing based on fwd_count_mask
-                if self.fwd_count_mask == 0:
-                    interval = 0.125  # 8 ticks/sec
-                elif self.fwd_count_mask == 1:
-                    interval = 0.25  # 4 ticks/sec
-                elif self.fwd_count_mask == 3:
-                    interval = 0.5  # 2 ticks/sec
-                else:  # fwd_count_mask == 7
-                    interval = 1.0  # 1 tick/sec
+                interval = _count_mask_interval(self.fwd_count_mask)
             elif self.reverse:
-                # Reverse timing based on rev_count_mask
-                if self.rev_count_mask == 0:
-                    interval = 0.125  # 8 ticks/sec
-                elif self.rev_count_mask == 1:
-                    interval = 0.25  # 4 ticks/sec
-                elif self.rev_count_mask == 3:
-                    interval = 0.5  # 2 ticks/sec
-                else:  # rev_count_mask == 7
-                    interval = 1.0  # 1 tick/sec
+                interval = _count_mask_interval(self.rev_count_mask)
             else:
                 # Normal ticking - 1 second intervals
                 interval = 1.0
 
-            time.sleep(interval)
+            if interval == 1.0 and last_interval != 1.0:
+                # Back from fast-forward or reverse, whose tick count need not
+                # add up to whole seconds - realign with the wall-clock second
+                deadline_ns = _next_second_deadline_ns()
+            else:
+                deadline_ns += int(interval * 1_000_000_000)
+            last_interval = interval
+            now_ns = time.monotonic_ns()
+            if deadline_ns < now_ns - 1_000_000_000:
+                # Fell too far behind (e.g. system suspend) - resync to the next
+                # whole second instead of bursting
+                deadline_ns = _next_second_deadline_ns()
+            _sleep_until(deadline_ns)
             if self.shutdown_event.is_set():
                 break
-            with self.lock:
-                if not self.paused:
-                    tick_event.set()
+            # Event is thread-safe on its own, no extra lock needed
+            if not self.paused:
+                tick_event.set()
 
     def _signal_handler(self, signum, frame):
+        # Only signal here: the main loop may be inside an I2C transfer or a
+        # pigpio command, so cleanup waits until it has stopped (see _shutdown)
         logging.info("Signal received, initiating graceful shutdown...")
         self.shutdown_event.set()
+        self.tick_event.set()
+        self.rtc_write_queue.put(None)
         logging.info("Shutdown signal sent to all threads")
-        time.sleep(1)
+
+    def _shutdown(self, rtc_writer_thread):
+        # Let a tick or burst waveform finish, so the hands end where FRAM
+        # says they are
+        self.finish_pulse()
+        self.write_time_to_fram()
+        # Wait for a queued RTC write instead of a fixed delay. The NTP sync
+        # thread and the web handlers also use the bus, but neither starts a
+        # transfer once shutdown_event is set.
+        rtc_writer_thread.join(SHUTDOWN_TIMEOUT)
         logging.info("Cleaning up GPIO and exiting...")
+        if self.pigpio is not None:
+            try:
+                self.pigpio.wave_clear()
+                self.pigpio.stop()
+            except Exception as e:
+                logging.error(f"Error closing pigpio connection: {e}")
         if self.hardware_available:
             try:
                 GPIO.cleanup()
@@ -502,52 +1491,107 @@ class ClockController:
                 logging.error(f"Error during GPIO cleanup: {e}")
         sys.exit(0)
 
+    def run_web_server(self):
+        # Applies to the waitress worker threads too, as they start from here
+        _lower_thread_priority()
+        if waitress_serve is None:
+            logging.warning(
+                "waitress not available, falling back to the Flask development server"
+            )
+            self.app.run(host=self.flask_host, port=self.flask_port)
+            return
+
+        waitress_serve(
+            self.app,
+            host=self.flask_host,
+            port=self.flask_port,
+            threads=self.flask_threads,
+        )
+
     def _setup_flask_routes(self):
         log = logging.getLogger("werkzeug")
         log.setLevel(logging.ERROR)
 
+        static_versions = {}
+
+        @self.app.url_defaults
+        def version_static_urls(endpoint, values):
+            """Add the file's modification time to url_for("static") links"""
+            if endpoint != "static" or "filename" not in values:
+                return
+            filename = values["filename"]
+            if filename not in static_versions:
+                # Looked up once: the files only change along with the code, and
+                # the service is restarted then anyway
+                path = os.path.join(self.app.static_folder, filename)
+                try:
+                    static_versions[filename] = int(os.stat(path).st_mtime)
+                except OSError:
+                    static_versions[filename] = 0
+            values["v"] = static_versions[filename]
+
+        def queue_rtc_time(hour, minute, second):
+            """Queue an RTC write of today's date at the given time"""
+            self.rtc_write_queue.put(
+                datetime.now().replace(
+                    hour=hour, minute=minute, second=second, microsecond=0
+                )
+            )
+
+        def handle_form_post(set_rtc):
+            """Handle the set_time/set_ntp forms shared by / and /config"""
+            form = request.form
+            if "set_time" in form:
+                try:
+                    hour = int(form["hour"])
+                    minute = int(form["minute"])
+                    second = int(form["second"])
+
+                    if (
+                        not (1 <= hour <= 12)
+                        or not (0 <= minute <= 59)
+                        or not (0 <= second <= 59)
+                    ):
+                        return "Invalid time values", 400
+
+                    self.set_clock_position(hour, minute, second)
+
+                    if set_rtc:
+                        queue_rtc_time(hour, minute, second)
+                    return redirect(url_for("config"))
+                except (ValueError, KeyError):
+                    return "Invalid input", 400
+            elif "set_ntp" in form:
+                try:
+                    ntp_server = form["ntp_server"].strip()
+                    ntp_sync_interval = int(form["ntp_sync_interval"])
+
+                    if not ntp_server or ntp_sync_interval < 1:
+                        return "Invalid NTP settings", 400
+
+                    self.ntp_server = ntp_server
+                    self.ntp_sync_interval = ntp_sync_interval
+                    return redirect(url_for("config"))
+                except (ValueError, KeyError):
+                    return "Invalid input", 400
+            return None
+
+        def render_page(template, **context):
+            """Render a template, reusing the HTML while its inputs are unchanged"""
+            key = tuple(context.values())
+            cached = self.page_responses.get(template)
+            if cached is None or cached[0] != key:
+                cached = (key, render_template(template, **context))
+                self.page_responses[template] = cached
+            return Response(cached[1], mimetype="text/html")
+
         @self.app.route("/", methods=["GET", "POST"])
         def index():
             if request.method == "POST":
-                if "set_time" in request.form:
-                    try:
-                        hour = int(request.form["hour"])
-                        minute = int(request.form["minute"])
-                        second = int(request.form["second"])
-
-                        if (
-                            not (1 <= hour <= 12)
-                            or not (0 <= minute <= 59)
-                            or not (0 <= second <= 59)
-                        ):
-                            return "Invalid time values", 400
-
-                        with self.clock_position_lock:
-                            self.clock_hour = hour
-                            self.clock_minute = minute
-                            self.clock_second = second
-
-                        initial_time = datetime.now().replace(
-                            hour=hour, minute=minute, second=second, microsecond=0
-                        )
-                        self.set_rtc_time(initial_time)
-                        return redirect(url_for("config"))
-                    except (ValueError, KeyError):
-                        return "Invalid input", 400
-                elif "set_ntp" in request.form:
-                    try:
-                        ntp_server = request.form["ntp_server"].strip()
-                        ntp_sync_interval = int(request.form["ntp_sync_interval"])
-
-                        if not ntp_server or ntp_sync_interval < 1:
-                            return "Invalid NTP settings", 400
-
-                        self.ntp_server = ntp_server
-                        self.ntp_sync_interval = ntp_sync_interval
-                        return redirect(url_for("config"))
-                    except (ValueError, KeyError):
-                        return "Invalid input", 400
-            return render_template(
+                response = handle_form_post(set_rtc=True)
+                if response is not None:
+                    return response
+            return render_page(
                 "index.html",
                 ntp_server=self.ntp_server,
                 ntp_sync_interval=self.ntp_sync_interval,
@@ -556,73 +1600,55 @@ class ClockController:
         @self.app.route("/config", methods=["GET", "POST"])
         def config():
             if request.method == "POST":
-                if "set_time" in request.form:
-                    try:
-                        hour = int(request.form["hour"])
-                        minute = int(request.form["minute"])
-                        second = int(request.form["second"])
-
-                        if (
-                            not (1 <= hour <= 12)
-                            or not (0 <= minute <= 59)
-                            or not (0 <= second <= 59)
-                        ):
-                            return "Invalid time values", 400
-
-                        with self.clock_position_lock:
-                            self.clock_hour = hour
-                            self.clock_minute = minute
-                            self.clock_second = second
-                        return redirect(url_for("config"))
-                    except (ValueError, KeyError):
-                        return "Invalid input", 400
-                elif "set_ntp" in request.form:
-                    try:
-                        ntp_server = request.form["ntp_server"].strip()
-                        ntp_sync_interval = int(request.form["ntp_sync_interval"])
-
-                        if not ntp_server or ntp_sync_interval < 1:
-                            return "Invalid NTP settings", 400
-
-                        self.ntp_server = ntp_server
-                        self.ntp_sync_interval = ntp_sync_interval
-                        return redirect(url_for("config"))
-                    except (ValueError, KeyError):
-                        return "Invalid input", 400
-            with self.clock_position_lock:
-                return render_template(
-                    "config.html",
-                    ntp_server=self.ntp_server,
-                    ntp_sync_interval=self.ntp_sync_interval,
-                    clock_hour=self.clock_hour,
-                    clock_minute=self.clock_minute,
-                    clock_second=self.clock_second,
-                )
+                response = handle_form_post(set_rtc=False)
+                if response is not None:
+                    return response
+            clock_hour, clock_minute, clock_second = self.get_clock_position()
+            return render_page(
+                "config.html",
+                ntp_server=self.ntp_server,
+                ntp_sync_interval=self.ntp_sync_interval,
+                clock_hour=clock_hour,
+                clock_minute=clock_minute,
+                clock_second=clock_second,
+            )
 
         @self.app.route("/api/current_time", methods=["GET"])
         def get_current_time():
-            rtc_time = self.get_rtc_time()
+            rtc_time = self.get_cached_rtc_time()
             if rtc_time:
-                return {
-                    "hour": rtc_time[0],
-                    "minute": rtc_time[1],
-                    "second": rtc_time[2],
-                }
+                cached_time, body = self.current_time_response
+                if cached_time != rtc_time:
+                    body = _json_dumps(
+                        {
+                            "hour": rtc_time[0],
+                            "minute": rtc_time[1],
+                            "second": rtc_time[2],
+                        }
+                    )
+                    self.current_time_response = (rtc_time, body)
+                return Response(body, mimetype="application/json")
             return {"error": "Failed to get current time"}, 500
 
         @self.app.route("/api/clock_time", methods=["GET"])
         def get_clock_time():
-            with self.clock_position_lock:
-                return {
-                    "hour": self.clock_hour,
-                    "minute": self.clock_minute,
-                    "second": self.clock_second,
-                }
+            # The packed position doubles as the cache key and the ETag
+            state = self.clock_state
+            cached_state, body, headers = self.clock_time_response
+            if cached_state != state:
+                hour, minute, second = _unpack_clock_position(state)
+                body = _json_dumps({"hour": hour, "minute": minute, "second": second})
+                headers = {**NO_CACHE, "ETag": f'"{state:x}"'}
+                self.clock_time_response = (state, body, headers)
+            etag = headers.get("ETag")
+            if etag is not None and request.headers.get("If-None-Match") == etag:
+                return Response(status=304, headers=headers)
+            return Response(body, mimetype="application/json", headers=headers)
 
         @self.app.route("/api/set_clock_time", methods=["POST"])
         def set_clock_time():
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
                 if not data:
                     return {"error": "Invalid JSON"}, 400
 
@@ -647,15 +1673,9 @@ class ClockController:
                 if not (0 <= second <= 59):
                     return {"error": "Second must be between 0 and 59"}, 400
 
-                with self.clock_position_lock:
-                    self.clock_hour = hour
-                    self.clock_minute = minute
-                    self.clock_second = second
+                self.set_clock_position(hour, minute, second)
 
-                initial_time = datetime.now().replace(
-                    hour=hour, minute=minute, second=second, microsecond=0
-                )
-                self.set_rtc_time(initial_time)
+                queue_rtc_time(hour, minute, second)
                 return {"message": "Clock time set successfully"}
             except Exception as e:
                 logging.error(f"Error in set_clock_time: {e}")
@@ -664,7 +1684,7 @@ class ClockController:
         @self.app.route("/api/ntp_server", methods=["POST"])
         def set_ntp_server():
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
                 if not data:
                     return {"error": "Invalid JSON"}, 400
 
@@ -682,12 +1702,13 @@ class ClockController:
             return {
                 "ntp_server": self.ntp_server,
                 "ntp_sync_interval": self.ntp_sync_interval,
+                "ntp_poll_interval": self.ntp_poll_interval,
             }
 
         @self.app.route("/api/ntp_settings", methods=["POST"])
         def set_ntp_settings():
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
                 if not data:
                     return {"error": "Invalid JSON"}, 400
 
@@ -717,20 +1738,24 @@ class ClockController:
 
         @self.app.route("/api/time_difference", methods=["GET"])
         def get_time_difference():
-            rtc_time = self.get_rtc_time()
+            rtc_time = self.get_cached_rtc_time()
             if rtc_time:
                 total_seconds_diff = self.calculate_time_difference(
                     rtc_time[0], rtc_time[1], rtc_time[2]
                 )
-                return {"time_difference_seconds": total_seconds_diff}
+                cached_diff, body = self.time_difference_response
+                if cached_diff != total_seconds_diff:
+                    body = _json_dumps({"time_difference_seconds": total_seconds_diff})
+                    self.time_difference_response = (total_seconds_diff, body)
+                return Response(body, mimetype="application/json")
             return {"error": "Failed to get time difference"}, 500
 
         @self.app.route("/api/ntp_drift", methods=["GET"])
         def get_ntp_drift():
             try:
-                ntp_client = ntplib.NTPClient()
-                ntp_response = ntp_client.request(self.ntp_server, version=3, port=123)
-                return {"ntp_offset_seconds": ntp_response.offset}
+                # Every open page polls this each second; share one exchange
+                # between them instead of querying the server per request
+                return {"ntp_offset_seconds": self.get_cached_ntp_offset()}
             except Exception as e:
                 return {"error": f"Failed to get NTP offset: {e}"}, 500
 
@@ -754,99 +1779,38 @@ class ClockController:
                 status = "Reverse"
             else:
                 status = "Ticking"
-            return {"status": status}
+
+            cached_status, body = self.clock_status_response
+            if cached_status != status:
+                body = _json_dumps({"status": status})
+                self.clock_status_response = (status, body)
+            return Response(body, mimetype="application/json", headers=NO_CACHE)
 
         @self.app.route("/api/pulsing_config", methods=["GET"])
         def get_pulsing_config():
             """Get current pulsing configuration"""
-            return {
-                "normal_tick_ms": self.norm_tick_ms,
-                "normal_tick_on_us": self.norm_tick_on_us,
-                "fast_forward_tick_ms": self.fwd_tick_ms,
-                "fast_forward_tick_on_us": self.fwd_tick_on_us,
-                "fast_forward_count_mask": self.fwd_count_mask,
-                "fast_forward_speedup": self.fwd_speedup,
-                "reverse_region_a_lo": self.rev_ticka_lo,
-                "reverse_region_a_hi": self.rev_ticka_hi,
-                "reverse_region_a_t1_ms": self.rev_ticka_t1_ms,
-                "reverse_region_a_t2_ms": self.rev_ticka_t2_ms,
-                "reverse_region_a_t3_ms": self.rev_ticka_t3_ms,
-                "reverse_region_a_on_us": self.rev_ticka_on_us,
-                "reverse_region_b_t1_ms": self.rev_tickb_t1_ms,
-                "reverse_region_b_t2_ms": self.rev_tickb_t2_ms,
-                "reverse_region_b_t3_ms": self.rev_tickb_t3_ms,
-                "reverse_region_b_on_us": self.rev_tickb_on_us,
-                "reverse_count_mask": self.rev_count_mask,
-                "reverse_speedup": self.rev_speedup,
-                "diff_threshold_hh": self.diff_threshold_hh,
-                "diff_threshold_mm": self.diff_threshold_mm,
-                "diff_threshold_ss": self.diff_threshold_ss,
-                "drift_tolerance_ss": self.drift_tolerance_ss,
-            }
+            return {key: getattr(self, attr) for key, attr in PULSING_CONFIG.items()}
 
         @self.app.route("/api/pulsing_config", methods=["POST"])
         def set_pulsing_config():
             """Update pulsing configuration"""
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
                 if not data:
                     return {"error": "Invalid JSON"}, 400
 
-                # Update normal tick parameters
-                if "normal_tick_ms" in data:
-                    self.norm_tick_ms = int(data["normal_tick_ms"])
-                if "normal_tick_on_us" in data:
-                    self.norm_tick_on_us = int(data["normal_tick_on_us"])
-
-                # Update fast-forward parameters
-                if "fast_forward_tick_ms" in data:
-                    self.fwd_tick_ms = int(data["fast_forward_tick_ms"])
-                if "fast_forward_tick_on_us" in data:
-                    self.fwd_tick_on_us = int(data["fast_forward_tick_on_us"])
-                if "fast_forward_count_mask" in data:
-                    self.fwd_count_mask = int(data["fast_forward_count_mask"])
-                if "fast_forward_speedup" in data:
-                    self.fwd_speedup = int(data["fast_forward_speedup"])
-
-                # Update reverse region A parameters
-                if "reverse_region_a_lo" in data:
-                    self.rev_ticka_lo = int(data["reverse_region_a_lo"])
-                if "reverse_region_a_hi" in data:
-                    self.rev_ticka_hi = int(data["reverse_region_a_hi"])
-                if "reverse_region_a_t1_ms" in data:
-                    self.rev_ticka_t1_ms = int(data["reverse_region_a_t1_ms"])
-                if "reverse_region_a_t2_ms" in data:
-                    self.rev_ticka_t2_ms = int(data["reverse_region_a_t2_ms"])
-                if "reverse_region_a_t3_ms" in data:
-                    self.rev_ticka_t3_ms = int(data["reverse_region_a_t3_ms"])
-                if "reverse_region_a_on_us" in data:
-                    self.rev_ticka_on_us = int(data["reverse_region_a_on_us"])
-
-                # Update reverse region B parameters
-                if "reverse_region_b_t1_ms" in data:
-                    self.rev_tickb_t1_ms = int(data["reverse_region_b_t1_ms"])
-                if "reverse_region_b_t2_ms" in data:
-                    self.rev_tickb_t2_ms = int(data["reverse_region_b_t2_ms"])
-                if "reverse_region_b_t3_ms" in data:
-                    self.rev_tickb_t3_ms = int(data["reverse_region_b_t3_ms"])
-                if "reverse_region_b_on_us" in data:
-                    self.rev_tickb_on_us = int(data["reverse_region_b_on_us"])
-                if "reverse_count_mask" in data:
-                    self.rev_count_mask = int(data["reverse_count_mask"])
-                if "reverse_speedup" in data:
-                    self.rev_speedup = int(data["reverse_speedup"])
-
-                # Update synchronization thresholds
-                if "diff_threshold_hh" in data:
-                    self.diff_threshold_hh = int(data["diff_threshold_hh"])
-                if "diff_threshold_mm" in data:
-                    self.diff_threshold_mm = int(data["diff_threshold_mm"])
-                if "diff_threshold_ss" in data:
-                    self.diff_threshold_ss = int(data["diff_threshold_ss"])
-
-                # Update drift tolerance
-                if "drift_tolerance_ss" in data:
-                    self.drift_tolerance_ss = int(data["drift_tolerance_ss"])
+                # Convert every value before assigning any, so a bad field
+                # leaves the configuration unchanged
+                updates = {
+                    attr: int(data[key])
+                    for key, attr in PULSING_CONFIG.items()
+                    if key in data
+                }
+                for attr in ("rtc_poll_ticks", "fwd_burst_max_ticks"):
+                    if attr in updates:
+                        updates[attr] = max(1, updates[attr])
+                for attr, value in updates.items():
+                    setattr(self, attr, value)
 
                 return {"message": "Pulsing configuration updated successfully"}
             except Exception as e:
@@ -854,21 +1818,24 @@ class ClockController:
                 return {"error": "Internal server error"}, 500
 
     def run(self):
-        tick_event = threading.Event()
+        tick_event = self.tick_event
 
-        time_string = self.read_time_from_fram()
-        if time_string:
-            hour, minute, second = map(int, time_string.split(":"))
-            with self.clock_position_lock:
-                self.clock_hour = hour % 12 or 12
-                self.clock_minute = minute
-                self.clock_second = second
+        # Claimed here rather than in __init__, so building the controller
+        # (e.g. just for its Flask app) never touches the GPIO or I2C bus
+        self._init_hardware()
+
+        fram_time = self.read_time_from_fram()
+        if fram_time:
+            hour, minute, second = fram_time
+            self.set_clock_position(hour % 12 or 12, minute, second)
 
         self.sync_rtc_time_with_ntp_time(on_startup=True)
 
-        timer_thread = threading.Thread(target=self.timer_callback, args=(tick_event,))
-        timer_thread.daemon = True
-        timer_thread.start()
+        # The background threads started first inherit every CPU but the last,
+        # which the tick threads then keep to themselves
+        tick_cpu = _tick_cpu()
+        if tick_cpu is not None:
+            _set_thread_affinity(os.sched_getaffinity(0) - {tick_cpu})
 
         sync_timer_thread = threading.Thread(
             target=self.continuous_sync_rtc_time_with_ntp_time
@@ -876,35 +1843,62 @@ class ClockController:
         sync_timer_thread.daemon = True
         sync_timer_thread.start()
 
-        flask_thread = threading.Thread(
-            target=self.app.run,
-            kwargs={"host": self.flask_host, "port": self.flask_port},
-        )
+        rtc_writer_thread = threading.Thread(target=self.rtc_writer)
+        rtc_writer_thread.daemon = True
+        rtc_writer_thread.start()
+
+        flask_thread = threading.Thread(target=self.run_web_server)
         flask_thread.daemon = True
         flask_thread.start()
 
+        # Pulses are emitted from this thread and the timer thread wakes it, so
+        # both run pinned and under SCHED_FIFO (inherited by the timer thread)
+        if tick_cpu is not None:
+            _set_thread_affinity({tick_cpu})
+        _raise_thread_priority()
+        _lock_memory()
+
+        timer_thread = threading.Thread(target=self.timer_callback, args=(tick_event,))
+        timer_thread.daemon = True
+        timer_thread.start()
+
+        # Keep this thread's timer slack low as well
+        _set_timer_slack()
         try:
             while not self.shutdown_event.is_set():
-                tick_event.wait(timeout=1)
+                tick_event.wait()
                 if self.shutdown_event.is_set():
                     break
-                with self.lock:
-                    tick_event.clear()
-                    # Only synchronize clock if not paused
-                    if not self.paused:
-                        self.synchronize_clock()
-                        self.write_time_to_fram()
-        except (KeyboardInterrupt, SystemExit):
+                tick_event.clear()
+                # Only synchronize clock if not paused. Position writes are
+                # guarded by clock_position_lock and FRAM is only written here
+                if not self.paused:
+                    self.synchronize_clock()
+                    # Runs while a DMA-timed tick pulse is still on the wire
+                    self.write_time_to_fram()
+                    self.finish_pulse()
+        except KeyboardInterrupt:
             self._signal_handler(None, None)
+        self._shutdown(rtc_writer_thread)
 
 
 def main():
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    # Records are written out by a listener thread, so logging from the tick
+    # or I2C paths never blocks on stderr
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     )
-
-    clock_controller = ClockController()
-    clock_controller.run()
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+
+    try:
+        clock_controller = ClockController()
+        clock_controller.run()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":